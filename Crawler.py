@@ -1,18 +1,44 @@
+import io
 import os
 import time
 import json
+import orjson
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tldextract
 import sqlite3
 import csv
 import random
 import re
 import yaml
+import copy
+import contextlib
+import threading
+import multiprocessing
+import ijson
 from dotenv import load_dotenv
 from pathlib import Path
+from urllib.parse import urlsplit
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Any
-import xml.etree.ElementTree as ET
+from typing import List, Dict, Optional, Any, Union, IO, Iterable
+from lxml import etree
+from db_admin import open_db, company_ids, latest_contacts_json
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import re2 as _dfa_re  # google-re2: linear-time scans over long HN/RSS text
+except ImportError:
+    _dfa_re = re
 
 BASE_DIR = Path(__file__).resolve().parent
 load_dotenv(BASE_DIR / ".env")
@@ -23,10 +49,26 @@ DATABASE_SOURCES_FILE = BASE_DIR / os.getenv("DATABASE_SOURCES_FILE", "free_data
 
 HUNTER_API_KEY = os.getenv("HUNTER_API_KEY", "")
 USER_AGENT = "MetaCrawler/1.0 (+polite; research)"
-CRAWL_DELAY = float(os.getenv("CRAWL_DELAY_SECONDS", "2.0"))  # Be extra polite with free sources
+HUNTER_QPS = float(os.getenv("HUNTER_QPS", "5"))  # Stay well under Hunter.io's per-second limit
+HUNTER_WORKERS = 8
+SAVE_CONTACTS_JSON = os.getenv("SAVE_CONTACTS_JSON", "false").lower() == "true"  # Optional contacts_*.json dump
 
 HEADERS = {"User-Agent": USER_AGENT, "Accept": "application/json"}
 
+# One pooled session so repeat hosts (GitHub raw, HN, Hunter) reuse keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# Built once with the bundled suffix list, so lookups never fetch or lock the PSL cache
+_TLD = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
 # Near HR_KEYWORDS and ENG_KEYWORDS, add:
 DECISION_MAKER_KEYWORDS = (
 "ceo", "cfo", "cto", "coo", "cmo", "chief", "president", "founder", "owner",
@@ -37,197 +79,237 @@ DECISION_MAKER_KEYWORDS = (
 HR_KEYWORDS = ("hr", "human resources", "recruiting", "talent", "people", "careers", "jobs", "hiring", "director")
 ENG_KEYWORDS = ("engineering", "engineer", "eng", "dev", "developer")
 
+# One alternation per keyword group so classify_contact scans each field once
+_DM_RE = re.compile('|'.join(map(re.escape, DECISION_MAKER_KEYWORDS)))
+_HR_RE = re.compile('|'.join(map(re.escape, HR_KEYWORDS)))
+_ENG_RE = re.compile('|'.join(map(re.escape, ENG_KEYWORDS)))
+# Any keyword at all: one scan rules out most contacts before the per-group checks
+_ANY_KW_RE = re.compile('|'.join(map(re.escape, dict.fromkeys(DECISION_MAKER_KEYWORDS + HR_KEYWORDS + ENG_KEYWORDS))))
+
+# Parser regexes, compiled once instead of on every call.
+# The HN/RSS scans use re2 when installed; inline flags keep them valid under plain re.
+_HN_COMPANY_RE = _dfa_re.compile(r'(?i)\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:is hiring|hiring)\b')
+_RSS_RE = _dfa_re.compile(
+    r'\b(?P<a>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:raises|launches|announces|secures)\b'
+    r'|\b(?:raised by|backed by|invested in)\s+(?P<b>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
+)
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_MD_BARE_URL_RE = re.compile(r'https?://[^\s\)\]>]+')
+_EDGAR_CLEAN_RE = re.compile(r'[^\w\s]')
+_ANGEL_RE = re.compile(r'href="/company/([^"]+)"[^>]*>([^<]+)</a>')
+_PRODUCT_RE = re.compile(r'href="/product/([^"]+)"[^>]*>([^<]+)</a>')
+
+# Link targets in GitHub markdown that are never companies
+_MD_SKIP_DOMAINS = frozenset({'github.com', 'twitter.com', 'linkedin.com', 'youtube.com',
+                              'medium.com', 'wikipedia.org', 'google.com', 'producthunt.com'})
+
+# Bare "name.tld" hosts for common single-label TLDs; anything else goes through tldextract
+_FAST_DOMAIN_RE = re.compile(r'^https?://([a-z0-9-]+\.(?:com|io|org|net|co|ai|dev))(?:[/:?#]|$)', re.IGNORECASE)
+
+# CSV header names tried for the URL and company name, in priority order
+_CSV_URL_FIELDS = ('url', 'website', 'domain', 'homepage', 'link', 'URL', 'Website')
+_CSV_NAME_FIELDS = ('name', 'company', 'Name', 'Company', 'title')
+
+_SITEMAP_LOC_TAGS = ('{http://www.sitemaps.org/schemas/sitemap/0.9}loc', 'loc')
+
 # ===== FREE PUBLIC DATABASE SOURCES =====
+# Built-in sources; free_databases.yaml is applied on top as overrides
+FREE_DATABASE_SOURCES = {
+    # ===== Y COMBINATOR SOURCES =====
+    "yc_export": {
+        "name": "Y Combinator Companies Export",
+        "url": "https://www.ycombinator.com/companies/export.json",
+        "type": "json",
+        "enabled": True,
+        "parser": "yc_json",
+        "description": "Official YC company list (free, no auth)",
+        "estimated_companies": 4000,
+    },
+    "yc_companies_page": {
+        "name": "YC Companies HTML Page",
+        "url": "https://www.ycombinator.com/companies",
+        "type": "html",
+        "enabled": True,
+        "parser": "yc_html",
+        "description": "YC companies directory page",
+        "estimated_companies": 100,
+    },
+
+    # ===== GITHUB DATASETS (FREE, PUBLIC) =====
+    "github_yc_dataset": {
+        "name": "GitHub YC Dataset",
+        "url": "https://raw.githubusercontent.com/saasify-sh/awesome-yc-companies/master/README.md",
+        "type": "markdown",
+        "enabled": True,
+        "parser": "github_markdown",
+        "description": "Awesome YC Companies list on GitHub",
+        "estimated_companies": 300,
+    },
+    "github_startup_resources": {
+        "name": "GitHub Startup Resources",
+        "url": "https://raw.githubusercontent.com/mmccaff/PlacesToPostYourStartup/master/README.md",
+        "type": "markdown",
+        "enabled": True,
+        "parser": "github_markdown",
+        "description": "Places to post your startup",
+        "estimated_companies": 200,
+    },
+    "github_awesome_startups": {
+        "name": "GitHub Awesome Startups",
+        "url": "https://raw.githubusercontent.com/atinfo/awesome-startups/master/README.md",
+        "type": "markdown",
+        "enabled": True,
+        "parser": "github_markdown",
+        "description": "Curated list of awesome startups",
+        "estimated_companies": 150,
+    },
+
+    # ===== PUBLIC API DATASETS (NO AUTH) =====
+    "public_apis_org": {
+        "name": "Public APIs Directory",
+        "url": "https://api.publicapis.org/entries",
+        "type": "json",
+        "enabled": True,
+        "parser": "public_apis",
+        "description": "Companies with public APIs",
+        "estimated_companies": 1000,
+    },
+
+    # ===== TECH NEWS/RSS FEEDS =====
+    "techcrunch_feed": {
+        "name": "TechCrunch RSS Feed",
+        "url": "https://techcrunch.com/feed/",
+        "type": "rss",
+        "enabled": True,
+        "parser": "rss_feed",
+        "description": "TechCrunch articles mentioning companies",
+        "estimated_companies": 50,
+    },
+    "hacker_news_whoishiring": {
+        "name": "Hacker News Who is Hiring",
+        "url": "https://hn.algolia.com/api/v1/search?tags=story,author_whoishiring",
+        "type": "json",
+        "enabled": True,
+        "parser": "hn_whoishiring",
+        "description": "HN Who is Hiring posts (mentions companies)",
+        "estimated_companies": 1000,
+    },
+
+    # ===== GOVERNMENT/OPEN DATA =====
+    "edgar_companies": {
+        "name": "SEC EDGAR Company List",
+        "url": "https://www.sec.gov/files/company_tickers.json",
+        "type": "json",
+        "enabled": True,
+        "parser": "edgar_companies",
+        "description": "All companies registered with SEC (US public companies)",
+        "estimated_companies": 8000,
+    },
+
+    # ===== LOCAL FILES (USER PROVIDED) =====
+    "local_domains": {
+        "name": "Local Domains File",
+        "path": "companies.txt",
+        "type": "local_txt",
+        "enabled": True,
+        "parser": "plain_text",
+        "description": "Your own list of target domains",
+        "estimated_companies": "variable",
+    },
+    "local_csv": {
+        "name": "Local CSV File",
+        "path": "companies.csv",
+        "type": "local_csv",
+        "enabled": False,
+        "parser": "csv",
+        "description": "Your own CSV with company data",
+        "estimated_companies": "variable",
+    },
+
+    # ===== (OPTIONAL / OFTEN BLOCKED) =====
+    # Keep these in defaults so YAML can enable/disable them, but expect blocks.
+    "crunchbase_open_data": {
+        "name": "Crunchbase Open Data Map",
+        "url": "https://data.crunchbase.com/docs/open-data-map",
+        "type": "html",
+        "enabled": False,
+        "parser": "crunchbase_sitemap",
+        "description": "Crunchbase sitemap for company discovery",
+        "estimated_companies": 500,
+    },
+    "opencorporates": {
+        "name": "OpenCorporates API",
+        "url": "https://api.opencorporates.com/v0.4/companies/search",
+        "type": "json",
+        "enabled": False,
+        "params": {"q": "technology", "per_page": 100},
+        "parser": "opencorporates",
+        "description": "Global corporate data (often auth / limited)",
+        "estimated_companies": 100,
+    },
+    "yellowpages_sitemap": {
+        "name": "YellowPages Sitemap",
+        "url": "https://www.yellowpages.com/sitemap.xml",
+        "type": "xml",
+        "enabled": False,
+        "parser": "sitemap_urls",
+        "description": "YellowPages business listings (often blocked)",
+        "estimated_companies": 100,
+    },
+    "angel_list_public": {
+        "name": "AngelList Public Pages",
+        "url": "https://angel.co/companies",
+        "type": "html",
+        "enabled": False,
+        "parser": "angel_list_scrape",
+        "description": "AngelList directory (often blocked / JS-heavy)",
+        "estimated_companies": 200,
+    },
+    "product_hunt_public": {
+        "name": "Product Hunt Today",
+        "url": "https://www.producthunt.com/",
+        "type": "html",
+        "enabled": False,
+        "parser": "product_hunt_scrape",
+        "description": "Product Hunt front page (often blocked / JS-heavy)",
+        "estimated_companies": 30,
+    },
+    "indie_hackers": {
+        "name": "Indie Hackers Products",
+        "url": "https://www.indiehackers.com/products",
+        "type": "html",
+        "enabled": False,
+        "parser": "indie_hackers_scrape",
+        "description": "Indie Hackers product directory (often blocked / JS-heavy)",
+        "estimated_companies": 500,
+    },
+    "betalist": {
+        "name": "BetaList Startups",
+        "url": "https://betalist.com/",
+        "type": "html",
+        "enabled": False,
+        "parser": "betalist_scrape",
+        "description": "BetaList startup directory (often blocks bots)",
+        "estimated_companies": 100,
+    },
+}
+
 def load_free_database_sources() -> Dict:
     """Load FREE public database sources that require NO API keys.
     YAML is treated as overrides (enabled/path/params/etc) unless it defines a brand-new source.
+    Returns a fresh copy each call, so callers may mutate it freely.
     """
+    return copy.deepcopy(_load_free_database_sources_cached())
 
-    defaults = {
-        # ===== Y COMBINATOR SOURCES =====
-        "yc_export": {
-            "name": "Y Combinator Companies Export",
-            "url": "https://www.ycombinator.com/companies/export.json",
-            "type": "json",
-            "enabled": True,
-            "parser": "yc_json",
-            "description": "Official YC company list (free, no auth)",
-            "estimated_companies": 4000,
-        },
-        "yc_companies_page": {
-            "name": "YC Companies HTML Page",
-            "url": "https://www.ycombinator.com/companies",
-            "type": "html",
-            "enabled": True,
-            "parser": "yc_html",
-            "description": "YC companies directory page",
-            "estimated_companies": 100,
-        },
-
-        # ===== GITHUB DATASETS (FREE, PUBLIC) =====
-        "github_yc_dataset": {
-            "name": "GitHub YC Dataset",
-            "url": "https://raw.githubusercontent.com/saasify-sh/awesome-yc-companies/master/README.md",
-            "type": "markdown",
-            "enabled": True,
-            "parser": "github_markdown",
-            "description": "Awesome YC Companies list on GitHub",
-            "estimated_companies": 300,
-        },
-        "github_startup_resources": {
-            "name": "GitHub Startup Resources",
-            "url": "https://raw.githubusercontent.com/mmccaff/PlacesToPostYourStartup/master/README.md",
-            "type": "markdown",
-            "enabled": True,
-            "parser": "github_markdown",
-            "description": "Places to post your startup",
-            "estimated_companies": 200,
-        },
-        "github_awesome_startups": {
-            "name": "GitHub Awesome Startups",
-            "url": "https://raw.githubusercontent.com/atinfo/awesome-startups/master/README.md",
-            "type": "markdown",
-            "enabled": True,
-            "parser": "github_markdown",
-            "description": "Curated list of awesome startups",
-            "estimated_companies": 150,
-        },
-
-        # ===== PUBLIC API DATASETS (NO AUTH) =====
-        "public_apis_org": {
-            "name": "Public APIs Directory",
-            "url": "https://api.publicapis.org/entries",
-            "type": "json",
-            "enabled": True,
-            "parser": "public_apis",
-            "description": "Companies with public APIs",
-            "estimated_companies": 1000,
-        },
-
-        # ===== TECH NEWS/RSS FEEDS =====
-        "techcrunch_feed": {
-            "name": "TechCrunch RSS Feed",
-            "url": "https://techcrunch.com/feed/",
-            "type": "rss",
-            "enabled": True,
-            "parser": "rss_feed",
-            "description": "TechCrunch articles mentioning companies",
-            "estimated_companies": 50,
-        },
-        "hacker_news_whoishiring": {
-            "name": "Hacker News Who is Hiring",
-            "url": "https://hn.algolia.com/api/v1/search?tags=story,author_whoishiring",
-            "type": "json",
-            "enabled": True,
-            "parser": "hn_whoishiring",
-            "description": "HN Who is Hiring posts (mentions companies)",
-            "estimated_companies": 1000,
-        },
-
-        # ===== GOVERNMENT/OPEN DATA =====
-        "edgar_companies": {
-            "name": "SEC EDGAR Company List",
-            "url": "https://www.sec.gov/files/company_tickers.json",
-            "type": "json",
-            "enabled": True,
-            "parser": "edgar_companies",
-            "description": "All companies registered with SEC (US public companies)",
-            "estimated_companies": 8000,
-        },
-
-        # ===== LOCAL FILES (USER PROVIDED) =====
-        "local_domains": {
-            "name": "Local Domains File",
-            "path": "companies.txt",
-            "type": "local_txt",
-            "enabled": True,
-            "parser": "plain_text",
-            "description": "Your own list of target domains",
-            "estimated_companies": "variable",
-        },
-        "local_csv": {
-            "name": "Local CSV File",
-            "path": "companies.csv",
-            "type": "local_csv",
-            "enabled": False,
-            "parser": "csv",
-            "description": "Your own CSV with company data",
-            "estimated_companies": "variable",
-        },
-
-        # ===== (OPTIONAL / OFTEN BLOCKED) =====
-        # Keep these in defaults so YAML can enable/disable them, but expect blocks.
-        "crunchbase_open_data": {
-            "name": "Crunchbase Open Data Map",
-            "url": "https://data.crunchbase.com/docs/open-data-map",
-            "type": "html",
-            "enabled": False,
-            "parser": "crunchbase_sitemap",
-            "description": "Crunchbase sitemap for company discovery",
-            "estimated_companies": 500,
-        },
-        "opencorporates": {
-            "name": "OpenCorporates API",
-            "url": "https://api.opencorporates.com/v0.4/companies/search",
-            "type": "json",
-            "enabled": False,
-            "params": {"q": "technology", "per_page": 100},
-            "parser": "opencorporates",
-            "description": "Global corporate data (often auth / limited)",
-            "estimated_companies": 100,
-        },
-        "yellowpages_sitemap": {
-            "name": "YellowPages Sitemap",
-            "url": "https://www.yellowpages.com/sitemap.xml",
-            "type": "xml",
-            "enabled": False,
-            "parser": "sitemap_urls",
-            "description": "YellowPages business listings (often blocked)",
-            "estimated_companies": 100,
-        },
-        "angel_list_public": {
-            "name": "AngelList Public Pages",
-            "url": "https://angel.co/companies",
-            "type": "html",
-            "enabled": False,
-            "parser": "angel_list_scrape",
-            "description": "AngelList directory (often blocked / JS-heavy)",
-            "estimated_companies": 200,
-        },
-        "product_hunt_public": {
-            "name": "Product Hunt Today",
-            "url": "https://www.producthunt.com/",
-            "type": "html",
-            "enabled": False,
-            "parser": "product_hunt_scrape",
-            "description": "Product Hunt front page (often blocked / JS-heavy)",
-            "estimated_companies": 30,
-        },
-        "indie_hackers": {
-            "name": "Indie Hackers Products",
-            "url": "https://www.indiehackers.com/products",
-            "type": "html",
-            "enabled": False,
-            "parser": "indie_hackers_scrape",
-            "description": "Indie Hackers product directory (often blocked / JS-heavy)",
-            "estimated_companies": 500,
-        },
-        "betalist": {
-            "name": "BetaList Startups",
-            "url": "https://betalist.com/",
-            "type": "html",
-            "enabled": False,
-            "parser": "betalist_scrape",
-            "description": "BetaList startup directory (often blocks bots)",
-            "estimated_companies": 100,
-        },
-    }
+@lru_cache(maxsize=1)
+def _load_free_database_sources_cached() -> Dict:
+    defaults = copy.deepcopy(FREE_DATABASE_SOURCES)
 
     # Apply YAML overrides
     if DATABASE_SOURCES_FILE.exists():
         try:
             with open(DATABASE_SOURCES_FILE, "r", encoding="utf-8") as f:
-                overrides = yaml.safe_load(f) or {}
+                overrides = yaml.load(f, Loader=_YamlLoader) or {}
 
             if not isinstance(overrides, dict):
                 print(f"Note: {DATABASE_SOURCES_FILE} must be a mapping of source_id -> config")
@@ -248,11 +330,19 @@ def utc_now_iso() -> str:
 
 def extract_domain(url: str) -> str:
     """Extract clean domain from URL"""
+    return _extract_domain_cached(url)
+
+@lru_cache(maxsize=65536)
+def _extract_domain_cached(url: str) -> str:
     try:
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
 
-        ext = tldextract.extract(url)
+        m = _FAST_DOMAIN_RE.match(url)
+        if m:
+            return m.group(1).lower()
+
+        ext = _TLD(url)
         if not ext.domain or not ext.suffix:
             raise ValueError(f"Could not extract domain from: {url}")
         return f"{ext.domain}.{ext.suffix}".lower()
@@ -261,21 +351,33 @@ def extract_domain(url: str) -> str:
 
 # ===== FREE PARSER FUNCTIONS (NO API KEYS NEEDED) =====
 
+def _yc_company(company: Any) -> Optional[Dict]:
+    """Build a company from one entry of the YC export"""
+    if not isinstance(company, dict):
+        return None
+    get = company.get  # ~4000 entries per run, skip the repeated attribute lookups
+    website = get('website')
+    if not website:
+        return None
+    return {
+        'name': get('name', ''),
+        'url': website,
+        'source': 'yc_export',
+        'metadata': {
+            'batch': get('batch'),
+            'status': get('status', 'active')
+        }
+    }
+
 def parse_yc_json(data: Any) -> List[Dict]:
     """Parse Y Combinator JSON export"""
     companies = []
     if isinstance(data, list):
+        append = companies.append
         for company in data:
-            if isinstance(company, dict) and company.get('website'):
-                companies.append({
-                    'name': company.get('name', ''),
-                    'url': company['website'],
-                    'source': 'yc_export',
-                    'metadata': {
-                        'batch': company.get('batch'),
-                        'status': company.get('status', 'active')
-                    }
-                })
+            parsed = _yc_company(company)
+            if parsed:
+                append(parsed)
     return companies
 
 def parse_public_apis(data: Any) -> List[Dict]:
@@ -293,25 +395,33 @@ def parse_public_apis(data: Any) -> List[Dict]:
                 })
     return companies
 
+def _edgar_company(entry: tuple) -> Optional[Dict]:
+    """Build a company from one (cik, info) pair of the EDGAR ticker file"""
+    cik, info = entry
+    if isinstance(info, dict):
+        # EDGAR doesn't have website, but we can construct from company name
+        name = info.get('title', '')
+        if name:
+            # Try to create a plausible domain
+            clean_name = _EDGAR_CLEAN_RE.sub('', name.lower())
+            base_name = clean_name.split()[0] if clean_name.split() else ''
+            if base_name:
+                return {
+                    'name': name,
+                    'url': f"https://{base_name}.com",
+                    'source': 'edgar',
+                    'metadata': info
+                }
+    return None
+
 def parse_edgar_companies(data: Any) -> List[Dict]:
     """Parse SEC EDGAR company data"""
     companies = []
     if isinstance(data, dict):
-        for cik, info in data.items():
-            if isinstance(info, dict):
-                # EDGAR doesn't have website, but we can construct from company name
-                name = info.get('title', '')
-                if name:
-                    # Try to create a plausible domain
-                    clean_name = re.sub(r'[^\w\s]', '', name.lower())
-                    base_name = clean_name.split()[0] if clean_name.split() else ''
-                    if base_name:
-                        companies.append({
-                            'name': name,
-                            'url': f"https://{base_name}.com",
-                            'source': 'edgar',
-                            'metadata': info
-                        })
+        for entry in data.items():
+            parsed = _edgar_company(entry)
+            if parsed:
+                companies.append(parsed)
     return companies
 
 def parse_opencorporates(data: Any) -> List[Dict]:
@@ -340,8 +450,7 @@ def parse_hn_whoishiring(data: Any) -> List[Dict]:
             text = hit.get('title', '') + ' ' + hit.get('text', '')
             # Look for company names in the text
             # Simple regex to find potential company mentions
-            company_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:is hiring|hiring)\b'
-            matches = re.findall(company_pattern, text, re.IGNORECASE)
+            matches = _HN_COMPANY_RE.findall(text)
             for match in matches:
                 if len(match.split()) <= 4:  # Likely a company name
                     companies.append({
@@ -352,17 +461,33 @@ def parse_hn_whoishiring(data: Any) -> List[Dict]:
                     })
     return companies
 
-def parse_sitemap_urls(xml_content: str) -> List[Dict]:
-    """Parse sitemap XML for URLs"""
+def _xml_input(xml_content: Union[bytes, IO[bytes]]) -> IO[bytes]:
+    """Give iterparse a binary file so lxml honours the document's own encoding declaration"""
+    if isinstance(xml_content, str):
+        # iterparse would take a str for a file name, and decoded text has lost its real encoding
+        raise TypeError("XML parsers take the raw body bytes or a binary file, not str")
+    if isinstance(xml_content, bytes):
+        return io.BytesIO(xml_content)
+    return xml_content
+
+def _iter_xml(source: IO[bytes], tag) -> Iterable:
+    """Matching elements from iterparse, opened lazily so parse errors land in the consumer's try"""
+    for _, elem in etree.iterparse(source, tag=tag, recover=True):
+        yield elem
+
+# Item caps for the XML feeds (the streaming fetch stops downloading once reached)
+_SITEMAP_LIMIT = 100
+_RSS_LIMIT = 50
+
+def _sitemap_companies(locs: Iterable) -> List[Dict]:
+    """Build companies from sitemap <loc> elements"""
     companies = []
     try:
-        root = ET.fromstring(xml_content)
-        # Look for URLs in sitemap
-        namespaces = {'sm': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-        urls = root.findall('.//sm:loc', namespaces) or root.findall('.//loc')
-
-        for url_elem in urls[:100]:  # Limit to first 100
+        for i, url_elem in enumerate(locs):
+            if i >= _SITEMAP_LIMIT:  # Limit to first 100
+                break
             url = url_elem.text
+            url_elem.clear()
             if url and ("company" in url.lower() or "business" in url.lower()):
                 try:
                     domain = extract_domain(url)
@@ -379,16 +504,20 @@ def parse_sitemap_urls(xml_content: str) -> List[Dict]:
 
     return companies
 
-def parse_rss_feed(xml_content: str) -> List[Dict]:
-    """Parse RSS feed for company mentions"""
+def parse_sitemap_urls(xml_content: Union[bytes, IO[bytes]]) -> List[Dict]:
+    """Parse sitemap XML for URLs"""
+    # Stream <loc> elements instead of building the whole tree
+    return _sitemap_companies(_iter_xml(_xml_input(xml_content), _SITEMAP_LOC_TAGS))
+
+def _rss_companies(items: Iterable) -> List[Dict]:
+    """Build companies from RSS <item> elements"""
     companies = []
+    seen_names = set()
     try:
-        root = ET.fromstring(xml_content)
-
-        # Look for items/articles
-        for item in root.findall('.//item')[:50]:  # Limit to 50 items
+        for i, item in enumerate(items):
+            if i >= _RSS_LIMIT:  # Limit to 50 items
+                break
             title = item.find('title')
-            link = item.find('link')
             description = item.find('description')
 
             if title is not None and title.text:
@@ -398,44 +527,49 @@ def parse_rss_feed(xml_content: str) -> List[Dict]:
                     text += ' ' + description.text
 
                 # Look for patterns like "Company raises $", "Company launches"
-                patterns = [
-                    r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:raises|launches|announces|secures)\b',
-                    r'\b(?:raised by|backed by|invested in)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
-                ]
-
-                for pattern in patterns:
-                    matches = re.findall(pattern, text)
-                    for match in matches:
-                        if 1 <= len(match.split()) <= 3:  # Reasonable company name length
+                taken = set()
+                for m in _RSS_RE.finditer(text):
+                    kind = m.lastgroup
+                    if kind in taken:
+                        continue
+                    match = m.group(kind)
+                    if 1 <= len(match.split()) <= 3:  # Reasonable company name length
+                        taken.add(kind)  # Only take first match of each pattern per item
+                        if match not in seen_names:  # Deduplicate by name
+                            seen_names.add(match)
                             companies.append({
                                 'name': match,
                                 'url': f"https://{match.lower().replace(' ', '')}.com",
                                 'source': 'rss_feed',
                                 'metadata': {'title': title.text[:100]}
                             })
-                            break  # Only take first match per item
+                        if len(taken) == 2:
+                            break
+
+            item.clear()  # Free the item once it has been scanned
     except Exception as e:
         print(f"Error parsing RSS: {e}")
 
-    return list({c['name']: c for c in companies}.values())  # Deduplicate by name
+    return companies
+
+def parse_rss_feed(xml_content: Union[bytes, IO[bytes]]) -> List[Dict]:
+    """Parse RSS feed for company mentions"""
+    # Look for items/articles, streaming them one at a time
+    return _rss_companies(_iter_xml(_xml_input(xml_content), 'item'))
 
 def parse_github_markdown(text: str) -> List[Dict]:
     """Extract company URLs from GitHub markdown"""
     companies = []
 
     # Look for markdown links
-    url_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-    matches = re.findall(url_pattern, text)
+    matches = _MD_LINK_RE.findall(text)
 
     for link_text, url in matches:
         if url.startswith('http'):
             try:
                 domain = extract_domain(url)
                 # Skip common non-company domains
-                skip_domains = ['github.com', 'twitter.com', 'linkedin.com', 'youtube.com',
-                                'medium.com', 'wikipedia.org', 'google.com', 'producthunt.com']
-
-                if not any(skip in domain for skip in skip_domains):
+                if domain not in _MD_SKIP_DOMAINS:
                     companies.append({
                         'name': link_text[:50],
                         'url': url,
@@ -446,11 +580,12 @@ def parse_github_markdown(text: str) -> List[Dict]:
                 continue
 
     # Also look for bare URLs
-    bare_url_pattern = r'https?://[^\s\)\]>]+'
-    bare_matches = re.findall(bare_url_pattern, text)
+    bare_matches = _MD_BARE_URL_RE.findall(text)
 
+    seen_urls = {c['url'] for c in companies}
     for url in bare_matches:
-        if url not in [c['url'] for c in companies]:  # Avoid duplicates
+        if url not in seen_urls:  # Avoid duplicates
+            seen_urls.add(url)
             try:
                 domain = extract_domain(url)
                 if '.' in domain and len(domain) > 4:
@@ -491,29 +626,30 @@ def parse_csv_content(csv_text: str) -> List[Dict]:
     """Parse CSV content"""
     companies = []
     try:
-        import io
-        f = io.StringIO(csv_text)
-        reader = csv.DictReader(f)
+        reader = csv.reader(io.StringIO(csv_text))
+        header = next(reader, None)
+        if not header:
+            return companies
+
+        # Resolve column positions once from the header (last duplicate wins, like DictReader)
+        columns = {field: i for i, field in enumerate(header)}
+        url_idx = [columns[f] for f in _CSV_URL_FIELDS if f in columns]
+        if not url_idx:
+            return companies
+        name_idx = [columns[f] for f in _CSV_NAME_FIELDS if f in columns]
+        meta_cols = [(f, i) for f, i in columns.items() if f not in _CSV_URL_FIELDS and f not in _CSV_NAME_FIELDS]
 
         for row in reader:
-            # Try different column names for URL
-            url_fields = ['url', 'website', 'domain', 'homepage', 'link', 'URL', 'Website']
-            url = None
+            if not row:
+                continue
+            n = len(row)
 
-            for field in url_fields:
-                if field in row and row[field]:
-                    url = row[field]
-                    break
+            # Try different column names for URL
+            url = next((row[i] for i in url_idx if i < n and row[i]), None)
 
             if url:
                 # Get company name
-                name_fields = ['name', 'company', 'Name', 'Company', 'title']
-                name = ''
-
-                for field in name_fields:
-                    if field in row and row[field]:
-                        name = row[field]
-                        break
+                name = next((row[i] for i in name_idx if i < n and row[i]), '')
 
                 if not name:
                     # Extract from URL
@@ -527,7 +663,7 @@ def parse_csv_content(csv_text: str) -> List[Dict]:
                     'name': name,
                     'url': url if url.startswith('http') else f"https://{url}",
                     'source': 'csv',
-                    'metadata': {k: v for k, v in row.items() if k not in url_fields + name_fields}
+                    'metadata': {f: row[i] if i < n else None for f, i in meta_cols}
                 })
     except Exception as e:
         print(f"Error parsing CSV: {e}")
@@ -541,8 +677,7 @@ def scrape_angel_list(html: str) -> List[Dict]:
     companies = []
 
     # Simple regex scraping (more robust would use BeautifulSoup)
-    company_pattern = r'href="/company/([^"]+)"[^>]*>([^<]+)</a>'
-    matches = re.findall(company_pattern, html)
+    matches = _ANGEL_RE.findall(html)
 
     for company_slug, company_name in matches[:100]:  # Limit to 100
         if company_name and company_slug:
@@ -560,8 +695,7 @@ def scrape_product_hunt(html: str) -> List[Dict]:
     companies = []
 
     # Look for product links
-    product_pattern = r'href="/product/([^"]+)"[^>]*>([^<]+)</a>'
-    matches = re.findall(product_pattern, html)
+    matches = _PRODUCT_RE.findall(html)
 
     for product_slug, product_name in matches[:30]:
         if product_name and product_slug:
@@ -579,8 +713,7 @@ def scrape_indie_hackers(html: str) -> List[Dict]:
     companies = []
 
     # Look for product links
-    product_pattern = r'href="/product/([^"]+)"[^>]*>([^<]+)</a>'
-    matches = re.findall(product_pattern, html)
+    matches = _PRODUCT_RE.findall(html)
 
     for product_slug, product_name in matches[:50]:
         if product_name and product_slug:
@@ -595,8 +728,87 @@ def scrape_indie_hackers(html: str) -> List[Dict]:
 
 # ===== DATABASE FETCHER =====
 
-def fetch_from_free_source(source_id: str, source_config: Dict) -> List[Dict]:
-    """Fetch companies from a free source"""
+# Map parser names to functions
+PARSERS = {
+    'yc_json': parse_yc_json,
+    'public_apis': parse_public_apis,
+    'edgar_companies': parse_edgar_companies,
+    'opencorporates': parse_opencorporates,
+    'hn_whoishiring': parse_hn_whoishiring,
+    'sitemap_urls': parse_sitemap_urls,
+    'rss_feed': parse_rss_feed,
+    'github_markdown': parse_github_markdown,
+    'plain_text': parse_plain_text,
+    'csv': parse_csv_content,
+    'angel_list_scrape': scrape_angel_list,
+    'product_hunt_scrape': scrape_product_hunt,
+    'indie_hackers_scrape': scrape_indie_hackers,
+    'yc_html': scrape_angel_list,  # Reuse for now
+    'crunchbase_sitemap': parse_sitemap_urls,
+    'betalist_scrape': scrape_product_hunt  # Reuse for now
+}
+
+# Large JSON sources parsed entry by entry while downloading:
+# parser name -> (ijson reader, prefix, per-entry builder)
+_JSON_STREAMS = {
+    'yc_json': (ijson.items, 'item', _yc_company),
+    'edgar_companies': (ijson.kvitems, '', _edgar_company),
+}
+
+# XML parsers fed while the body downloads:
+# parser name -> (element tag(s), item cap, element consumer)
+_XML_STREAMS = {
+    'sitemap_urls': (_SITEMAP_LOC_TAGS, _SITEMAP_LIMIT, _sitemap_companies),
+    'rss_feed': ('item', _RSS_LIMIT, _rss_companies),
+    'crunchbase_sitemap': (_SITEMAP_LOC_TAGS, _SITEMAP_LIMIT, _sitemap_companies),
+}
+
+# Bodies at least this big are parsed in a worker process instead of on the event loop
+_PARSE_POOL_MIN_BYTES = 256 * 1024
+
+def parse_body(parser_name: str, source_type: str, body: bytes, encoding: str) -> List[Dict]:
+    """Decode a fetched body and run its parser (top-level so worker processes can run it)"""
+    parser = PARSERS[parser_name]
+    if parser_name in _XML_STREAMS:
+        return parser(body)  # lxml takes the raw bytes whatever the source type
+
+    text = body.decode(encoding, errors='replace')
+    if source_type in ('xml', 'rss', 'html'):
+        return parser(text)
+
+    try:  # JSON
+        return parser(orjson.loads(body))
+    except json.JSONDecodeError:
+        return parser(text)
+
+async def aparse_json_stream(parser_name: str, content) -> List[Dict]:
+    """Parse a streamed aiohttp JSON body entry by entry without loading it whole"""
+    reader, prefix, build = _JSON_STREAMS[parser_name]
+    companies = []
+    append = companies.append
+    async for entry in reader(content, prefix, use_float=True):
+        parsed = build(entry)
+        if parsed:
+            append(parsed)
+    return companies
+
+async def aparse_xml_stream(parser_name: str, content) -> List[Dict]:
+    """Feed an aiohttp XML body to lxml chunk by chunk; stop downloading at the item cap"""
+    tag, limit, consume = _XML_STREAMS[parser_name]
+    pull = etree.XMLPullParser(events=('end',), tag=tag, recover=True)
+    elements = []
+    async for chunk in content.iter_chunked(64 * 1024):
+        pull.feed(chunk)
+        elements.extend(elem for _, elem in pull.read_events())
+        if len(elements) >= limit:
+            break  # Leaving the response unread closes the connection mid-download
+    else:
+        pull.close()
+        elements.extend(elem for _, elem in pull.read_events())
+    return consume(elements)
+
+def fetch_from_local_source(source_id: str, source_config: Dict) -> List[Dict]:
+    """Fetch companies from a local-file source (remote ones go through afetch_from_free_source)"""
     name = source_config.get('name', source_id)
     enabled = source_config.get('enabled', True)
 
@@ -609,101 +821,140 @@ def fetch_from_free_source(source_id: str, source_config: Dict) -> List[Dict]:
         source_type = source_config.get('type', 'json')
         parser_name = source_config.get('parser', 'json')
 
-        # Map parser names to functions
-        parsers = {
-            'yc_json': parse_yc_json,
-            'public_apis': parse_public_apis,
-            'edgar_companies': parse_edgar_companies,
-            'opencorporates': parse_opencorporates,
-            'hn_whoishiring': parse_hn_whoishiring,
-            'sitemap_urls': parse_sitemap_urls,
-            'rss_feed': parse_rss_feed,
-            'github_markdown': parse_github_markdown,
-            'plain_text': parse_plain_text,
-            'csv': parse_csv_content,
-            'angel_list_scrape': scrape_angel_list,
-            'product_hunt_scrape': scrape_product_hunt,
-            'indie_hackers_scrape': scrape_indie_hackers,
-            'yc_html': scrape_angel_list,  # Reuse for now
-            'crunchbase_sitemap': parse_sitemap_urls,
-            'betalist_scrape': scrape_product_hunt  # Reuse for now
-        }
-
-        parser = parsers.get(parser_name)
+        parser = PARSERS.get(parser_name)
         if not parser:
             print(f"    ⚠ Unknown parser: {parser_name}")
             return []
 
-        # Handle local files
-        if source_type.startswith('local_'):
-            file_path = Path(source_config.get('path', ''))
-            if not file_path.exists():
-                file_path = BASE_DIR / file_path
+        if not source_type.startswith('local_'):
+            print(f"    ⚠ Not a local source: {source_type}")
+            return []
 
-            if file_path.exists():
-                content = file_path.read_text(encoding='utf-8', errors='ignore')
+        file_path = Path(source_config.get('path', ''))
+        if not file_path.exists():
+            file_path = BASE_DIR / file_path
 
-                if source_type == 'local_json':
-                    try:
-                        data = json.loads(content)
-                        companies = parser(data)
-                    except json.JSONDecodeError:
-                        companies = parser(content)
-                else:
-                    companies = parser(content)
+        if not file_path.exists():
+            print(f"    ⚠ File not found: {file_path}")
+            return []
 
-                print(f"    → Found {len(companies)} companies")
-                return companies
-            else:
-                print(f"    ⚠ File not found: {file_path}")
-                return []
+        if parser_name in _XML_STREAMS:
+            # XML parsers get raw bytes so the file's encoding declaration is respected
+            companies = parser(file_path.read_bytes())
+            print(f"    → Found {len(companies)} companies")
+            return companies
+
+        content = file_path.read_text(encoding='utf-8', errors='ignore')
+
+        if source_type == 'local_json':
+            try:
+                data = orjson.loads(content)
+                companies = parser(data)
+            except json.JSONDecodeError:
+                companies = parser(content)
+        else:
+            companies = parser(content)
+
+        print(f"    → Found {len(companies)} companies")
+        return companies
+
+    except Exception as e:
+        print(f"    ✗ Error: {e}")
+        return []
+
+async def _polite_wait(host_slots: Dict[str, float], url: str):
+    """Space requests to the same host 1-2s apart; other hosts are not held up"""
+    loop = asyncio.get_running_loop()
+    host = urlsplit(url).netloc.lower()
+    now = loop.time()
+    start = max(now, host_slots.get(host, 0.0))
+    host_slots[host] = start + random.uniform(1.0, 2.0)
+    if start > now:
+        await asyncio.sleep(start - now)
+
+async def afetch_from_free_source(session: aiohttp.ClientSession, sem: asyncio.BoundedSemaphore,
+                                  source_id: str, source_config: Dict,
+                                  host_slots: Optional[Dict[str, float]] = None,
+                                  pool: Optional[ProcessPoolExecutor] = None) -> List[Dict]:
+    """Fetch companies from a free source without blocking the other sources"""
+    source_type = source_config.get('type', 'json')
+
+    # Local files have no network wait, the sync path handles them fine
+    if source_type.startswith('local_'):
+        return fetch_from_local_source(source_id, source_config)
+
+    name = source_config.get('name', source_id)
+    enabled = source_config.get('enabled', True)
+
+    if not enabled:
+        return []
+
+    print(f"  📡 [{source_id}] {name}")
+
+    try:
+        parser_name = source_config.get('parser', 'json')
+        parser = PARSERS.get(parser_name)
+        if not parser:
+            print(f"    ⚠ Unknown parser: {parser_name}")
+            return []
 
-        # Handle remote sources
         url = source_config.get('url')
         if not url:
             print(f"    ⚠ No URL specified")
             return []
 
-        # Make request with polite delays
-        time.sleep(random.uniform(1.0, 2.0))
-
-        if source_type == 'xml' or source_type == 'rss':
-            response = requests.get(url, headers=HEADERS, timeout=30)
-            if response.status_code == 200:
-                companies = parser(response.text)
-            else:
-                print(f"    ✗ HTTP {response.status_code}")
-                return []
+        # Polite delay per host; sources on other hosts keep going meanwhile
+        await _polite_wait(host_slots if host_slots is not None else {}, url)
 
-        elif source_type == 'html':
-            response = requests.get(url, headers=HEADERS, timeout=30)
-            if response.status_code == 200:
-                companies = parser(response.text)
-            else:
-                print(f"    ✗ HTTP {response.status_code}")
-                return []
+        params = source_config.get('params', {}) if source_type not in ('xml', 'rss', 'html') else None
 
-        else:  # JSON
-            params = source_config.get('params', {})
-            response = requests.get(url, params=params, headers=HEADERS, timeout=30)
+        async with sem:
+            async with session.get(url, params=params, headers=HEADERS,
+                                   timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status != 200:
+                    print(f"    ✗ [{source_id}] HTTP {response.status}")
+                    return []
 
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    companies = parser(data)
-                except json.JSONDecodeError:
-                    companies = parser(response.text)
+                body = None
+                if parser_name in _JSON_STREAMS and source_type not in ('xml', 'rss', 'html'):
+                    companies = await aparse_json_stream(parser_name, response.content)
+                elif parser_name in _XML_STREAMS:
+                    companies = await aparse_xml_stream(parser_name, response.content)
+                else:
+                    body = await response.read()
+                    encoding = response.get_encoding()
+
+        if body is not None:
+            # Big payloads are parsed on another core so other sources keep flowing
+            if pool is not None and len(body) >= _PARSE_POOL_MIN_BYTES:
+                loop = asyncio.get_running_loop()
+                companies = await loop.run_in_executor(pool, parse_body, parser_name, source_type, body, encoding)
             else:
-                print(f"    ✗ HTTP {response.status_code}")
-                return []
+                companies = parse_body(parser_name, source_type, body, encoding)
 
-        print(f"    → Found {len(companies)} companies")
+        print(f"    → [{source_id}] Found {len(companies)} companies")
         return companies
 
     except Exception as e:
-        print(f"    ✗ Error: {e}")
+        print(f"    ✗ [{source_id}] Error: {e}")
         return []
 
+async def _fetch_all_free_sources(enabled_sources: Dict) -> List[List[Dict]]:
+    """Fetch every enabled source concurrently"""
+    sem = asyncio.BoundedSemaphore(20)
+    host_slots = {}  # host -> loop time its next request may start
+    # forkserver/spawn workers start clean instead of inheriting the event loop,
+    # aiohttp session and sqlite handles that fork would copy mid-run
+    ctx = multiprocessing.get_context(
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    )
+    with ProcessPoolExecutor(mp_context=ctx) as pool:  # Workers only start if a large body shows up
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=50)) as session:
+            return await asyncio.gather(*[
+                afetch_from_free_source(session, sem, sid, cfg, host_slots, pool)
+                for sid, cfg in enabled_sources.items()
+            ])
+
 # ===== MAIN FUNCTIONS =====
 
 def discover_companies_from_local_file_only() -> List[Dict]:
@@ -726,20 +977,17 @@ def discover_companies_from_local_file_only() -> List[Dict]:
     print(f"📄 Using source: {source_config.get('name', 'local_domains')}")
 
     # Fetch from local file only
-    companies = fetch_from_free_source('local_domains', source_config)
+    companies = fetch_from_local_source('local_domains', source_config)
 
     # Deduplicate
-    unique_companies = []
-    seen_domains = set()
-
+    by_domain = {}
     for company in companies:
         try:
             domain = extract_domain(company['url'])
-            if domain not in seen_domains:
-                seen_domains.add(domain)
-                unique_companies.append(company)
-        except:
+        except Exception:
             continue
+        by_domain.setdefault(domain, company)
+    unique_companies = list(by_domain.values())
 
     print(f"\n{'=' * 60}")
     print(f"📊 LOCAL FILE COMPANIES FOUND: {len(unique_companies)}")
@@ -749,6 +997,32 @@ def discover_companies_from_local_file_only() -> List[Dict]:
 
 # ===== HUNTER.IO INTEGRATION =====
 
+class _RateLimiter:
+    """Token bucket shared by the Hunter.io worker threads"""
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError(f"HUNTER_QPS must be positive, got {rate}")
+        self.rate = rate
+        # A one-token bucket spaces calls 1/rate apart, so no burst can exceed the limit
+        self.capacity = 1.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
 def hunter_domain_search(domain: str) -> dict:
     """Search for emails using Hunter.io API"""
     if not HUNTER_API_KEY:
@@ -757,9 +1031,9 @@ def hunter_domain_search(domain: str) -> dict:
     url = "https://api.hunter.io/v2/domain-search"
     params = {"domain": domain, "api_key": HUNTER_API_KEY}
 
-    r = requests.get(url, params=params, headers=HEADERS, timeout=30)
+    r = _SESSION.get(url, params=params, timeout=30)
     r.raise_for_status()
-    return r.json()
+    return orjson.loads(r.content)
 
 
 def classify_contact(e: dict) -> int:
@@ -775,16 +1049,20 @@ def classify_contact(e: dict) -> int:
     # Combine all text fields for keyword search
     all_text = f"{email} {dept} {full_name} {position}"
 
+    # No keyword anywhere: only the generic/other split is left
+    if _ANY_KW_RE.search(all_text) is None:
+        return 3 if etype == "generic" else 4
+
     # Priority 0: Decision Makers (highest priority)
-    if any(k in all_text for k in DECISION_MAKER_KEYWORDS):
+    if _DM_RE.search(all_text) is not None:
         return 0
 
     # Priority 1: HR contacts
-    if any(k in dept for k in HR_KEYWORDS) or any(k in email for k in HR_KEYWORDS):
+    if _HR_RE.search(dept) or _HR_RE.search(email):
         return 1
 
     # Priority 2: Engineering contacts
-    if any(k in dept for k in ENG_KEYWORDS) or any(k in email for k in ENG_KEYWORDS):
+    if _ENG_RE.search(dept) or _ENG_RE.search(email):
         return 2
 
     # Priority 3: Generic contacts
@@ -795,14 +1073,20 @@ def classify_contact(e: dict) -> int:
     return 4
 
 
+def _clean(value) -> str:
+    return value.strip() if value else ""
+
 def extract_ranked_contacts(hunter_response: dict, domain: str) -> tuple[str, list[dict]]:
     """Extract and rank contacts from Hunter.io response with decision makers first"""
     data = hunter_response.get("data", {}) or {}
     organization = data.get("organization") or domain
 
-    ranked = []
+    # (priority, -confidence, lowercased email, contact) so sorting needs no per-item lambda
+    keyed = []
+    append = keyed.append
     for e in data.get("emails", []) or []:
-        email_val = (e.get("value") or "").strip()
+        get = e.get
+        email_val = _clean(get("value"))
         if not email_val:
             continue
 
@@ -813,76 +1097,114 @@ def extract_ranked_contacts(hunter_response: dict, domain: str) -> tuple[str, li
         if priority > 3:
             continue
 
-        name = f"{(e.get('first_name') or '').strip()} {(e.get('last_name') or '').strip()}".strip() or "N/A"
+        name = f"{_clean(get('first_name'))} {_clean(get('last_name'))}".strip() or "N/A"
+        confidence = get("confidence")
 
-        # Add position if available
-        position = (e.get("position") or "").strip()
-
-        ranked.append({
+        append((priority, -(confidence or 0), email_val.lower(), {
             "email": email_val,
             "name": name,
-            "position": position,
-            "confidence": e.get("confidence"),
-            "type": (e.get("type") or "unknown").lower(),
-            "department": (e.get("department") or "").strip(),
+            "position": _clean(get("position")),  # Add position if available
+            "confidence": confidence,
+            "type": (get("type") or "unknown").lower(),
+            "department": _clean(get("department")),
             "priority": priority,
             "is_decision_maker": priority == 0,  # Flag for decision makers
-        })
+        }))
 
     # Sort by: priority (decision makers first), then confidence, then email
-    ranked.sort(key=lambda c: (c["priority"], -(c["confidence"] or 0), c["email"].lower()))
-
-    return organization, ranked
+    keyed.sort(key=itemgetter(0, 1, 2))
+
+    return organization, [entry[3] for entry in keyed]
+
+def upsert_company_and_contacts(conn: sqlite3.Connection, organization: str, domain: str, contacts: List[Dict]) -> int:
+    """Store one company's Hunter.io contacts; returns the company id"""
+    company_id = conn.execute(
+        """
+        INSERT INTO companies (domain, organization)
+        VALUES (?, ?)
+        ON CONFLICT(domain) DO UPDATE SET organization = excluded.organization
+        RETURNING id
+        """,
+        (domain, organization),
+    ).fetchone()[0]
+
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO contacts
+        (company_id, email, name, confidence, type, contacted)
+        VALUES (?, ?, ?, ?, ?, 0)
+        """,
+        [(company_id, c["email"], c["name"], c["confidence"], c["type"]) for c in contacts],
+    )
+    return company_id
 
 def process_companies(companies: List[Dict], max_companies: int = 50):
-    """Process companies with Hunter.io"""
+    """Process companies with Hunter.io, saving contacts to the database as they come in"""
     print(f"\n{'=' * 60}")
     print(f"PROCESSING UP TO {max_companies} COMPANIES")
     print(f"{'=' * 60}\n")
 
+    batch = companies[:max_companies]
+    limiter = _RateLimiter(HUNTER_QPS)
+
+    def lookup(company: Dict):
+        domain = extract_domain(company['url'])
+        limiter.acquire()
+        return domain, hunter_domain_search(domain)
+
     results = []
+    saved = 0
 
-    with sqlite3.connect(DB_PATH) as conn:
-        for i, company in enumerate(companies[:max_companies], 1):
-            try:
-                domain = extract_domain(company['url'])
-                print(f"[{i}/{len(companies[:max_companies])}] 🔍 {company.get('name', domain)[:40]} ({domain})")
-
-                # Skip if already processed recently (you'd add this check)
-
-                # Get contacts
-                hunter_data = hunter_domain_search(domain)
-                organization, contacts = extract_ranked_contacts(hunter_data, domain)
-
-                if contacts:
-                    print(f"    ✓ Found {len(contacts)} contacts")
-                    results.append({
-                        "company": company['name'],
-                        "domain": domain,
-                        "organization": organization,
-                        "contacts": contacts
-                    })
-                else:
-                    print(f"    ✗ No contacts found")
+    # Lookups run concurrently at HUNTER_QPS; only this thread touches the connection
+    with contextlib.closing(open_db(DB_PATH)) as conn, ThreadPoolExecutor(max_workers=HUNTER_WORKERS) as pool:
+        futures = {pool.submit(lookup, company): company for company in batch}
+        try:
+            for i, future in enumerate(as_completed(futures), 1):
+                company = futures[future]
+                try:
+                    domain, hunter_data = future.result()
+                    print(f"[{i}/{len(batch)}] 🔍 {company.get('name', domain)[:40]} ({domain})")
+
+                    # Skip if already processed recently (you'd add this check)
+
+                    organization, contacts = extract_ranked_contacts(hunter_data, domain)
+
+                    if contacts:
+                        print(f"    ✓ Found {len(contacts)} contacts")
+                        upsert_company_and_contacts(conn, organization, domain, contacts)
+                        saved += 1
+                        # Commit every few companies so a crash doesn't lose paid lookups
+                        if saved % 10 == 0:
+                            conn.commit()
+
+                        if SAVE_CONTACTS_JSON:
+                            results.append({
+                                "company": company['name'],
+                                "domain": domain,
+                                "organization": organization,
+                                "contacts": contacts
+                            })
+                    else:
+                        print(f"    ✗ No contacts found")
 
-                # Be polite to Hunter.io API
-                time.sleep(CRAWL_DELAY)
+                except Exception as e:
+                    print(f"[{i}/{len(batch)}] ✗ Error for {company.get('name', company.get('url'))}: {e}")
+        finally:
+            pool.shutdown(cancel_futures=True)
+            conn.commit()
 
-            except Exception as e:
-                print(f"    ✗ Error: {e}")
-                time.sleep(CRAWL_DELAY * 2)
+    print(f"\n✓ Saved {saved} companies with contacts to the database")
 
     # Save results
     if results:
         output_file = BASE_DIR / f"contacts_{datetime.now().strftime('%Y%m%d_%H%M')}.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2)
+        output_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
         print(f"\n✓ Saved {len(results)} companies with contacts to {output_file}")
 
     return results
 
 def init_db():
-    with sqlite3.connect(DB_PATH) as conn:
+    with contextlib.closing(open_db(DB_PATH)) as conn:
         conn.execute("""
         CREATE TABLE IF NOT EXISTS companies (
             id INTEGER PRIMARY KEY,
@@ -913,67 +1235,109 @@ def init_db():
         )
         """)
 
-        # Add missing columns if they don't exist
-        try:
+        # Add missing columns if they don't exist (checked first so boots don't try an ALTER)
+        company_cols = {row[1] for row in conn.execute("PRAGMA table_info(companies)")}
+        if "category" not in company_cols:
             conn.execute("ALTER TABLE companies ADD COLUMN category TEXT DEFAULT 'engineering'")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
 
-        try:
+        contact_cols = {row[1] for row in conn.execute("PRAGMA table_info(contacts)")}
+        if "retry_count" not in contact_cols:
             conn.execute("ALTER TABLE contacts ADD COLUMN retry_count INTEGER DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+
+        # fetch_send_queue walks pending contacts by confidence; keep that an index range scan
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_contacts_pending ON contacts(confidence DESC, id) WHERE contacted = 0")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_contacts_company ON contacts(company_id)")
+        # A full index on contacted shadows idx_contacts_pending before ANALYZE runs; drop it from older files
+        conn.execute("DROP INDEX IF EXISTS idx_contacts_contacted")
 
         conn.commit()
     print("Database initialized")
 
-def import_json_contacts(json_path: Path):
-    data = json.loads(json_path.read_text(encoding="utf-8"))
+def import_json_contacts(json_path: Path, batch_size: int = 1000):
+    """Stream a contacts JSON dump into the database, batch by batch, in one transaction"""
+
+    def flush(conn: sqlite3.Connection, company_rows: list, contact_rows: list):
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO companies 
+            (domain, organization, category) 
+            VALUES(?, ?, ?)
+            """,
+            company_rows,
+        )
+
+        # Look the ids up in chunks rather than one SELECT per company
+        domain_ids = company_ids(conn.cursor(), (row[0] for row in company_rows))
+
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO contacts
+            (company_id, email, name, confidence, type, contacted)
+            VALUES (?, ?, ?, ?, ?, 0)
+            """,
+            [(domain_ids[domain], email, name, confidence, ctype)
+             for domain, email, name, confidence, ctype in contact_rows],
+        )
 
-    with sqlite3.connect(DB_PATH) as conn:
-        for item in data:
+    with contextlib.closing(open_db(DB_PATH)) as conn, open(json_path, 'rb') as f:
+        company_rows = []
+        contact_rows = []
+        for item in ijson.items(f, 'item', use_float=True):
             domain = (item.get("domain") or "").strip()
             if not domain:
                 continue
 
-            # Insert company with default category
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO companies 
-                (domain, organization, category) 
-                VALUES(?, ?, ?)
-                """,
-                (domain, item.get("organization") or item.get("company") or domain, 'engineering'),
-            )
-
-            company_id = conn.execute(
-                "SELECT id FROM companies WHERE domain = ?",
-                (domain,),
-            ).fetchone()[0]
+            # Company with default category
+            company_rows.append((domain, item.get("organization") or item.get("company") or domain, 'engineering'))
 
             for c in item.get("contacts", []):
                 email = (c.get("email") or "").strip()
                 if not email:
                     continue
+                contact_rows.append((domain, email, c.get("name"), c.get("confidence"), c.get("type")))
 
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO contacts
-                    (company_id, email, name, confidence, type, contacted)
-                    VALUES (?, ?, ?, ?, ?, 0)
-                    """,
-                    (
-                        company_id,
-                        email,
-                        c.get("name"),
-                        c.get("confidence"),
-                        c.get("type"),
-                    ),
-                )
+            if len(company_rows) >= batch_size:
+                flush(conn, company_rows, contact_rows)
+                company_rows = []
+                contact_rows = []
+
+        if company_rows:
+            flush(conn, company_rows, contact_rows)
 
         conn.commit()
 
 
+def save_discovered_companies(companies: List[Dict]):
+    """Persist discovered companies in one transaction (existing domains are left alone)"""
+    rows = []
+    for company in companies:
+        try:
+            domain = extract_domain(company['url'])
+        except Exception:
+            continue
+        rows.append((
+            domain,
+            company.get('name') or domain,
+            company.get('source'),
+            orjson.dumps(company.get('metadata'), default=str, option=orjson.OPT_NON_STR_KEYS).decode(),
+        ))
+
+    conn = open_db(DB_PATH)
+    try:
+        with conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO companies
+                (domain, organization, discovered_from, metadata)
+                VALUES (?, ?, ?, ?)
+                """,
+                rows,
+            )
+    finally:
+        conn.close()
+    print(f"💾 Saved {len(rows)} discovered companies to database")
+
+
 def discover_companies_from_free_sources() -> List[Dict]:
     """
     Discover companies from ALL enabled free public sources
@@ -985,42 +1349,24 @@ def discover_companies_from_free_sources() -> List[Dict]:
     # Load all free sources
     sources = load_free_database_sources()
 
-    all_companies = []
-    enabled_count = 0
+    enabled_sources = {sid: config for sid, config in sources.items() if config.get('enabled', True)}
 
-    # Count enabled sources
-    for sid, config in sources.items():
-        if config.get('enabled', True):
-            enabled_count += 1
+    print(f"📡 Checking {len(enabled_sources)} enabled free sources concurrently...\n")
 
-    print(f"📡 Checking {enabled_count} enabled free sources...\n")
-
-    # Process each enabled source
-    for i, (source_id, source_config) in enumerate(sources.items(), 1):
-        if not source_config.get('enabled', True):
-            continue
-
-        name = source_config.get('name', source_id)
-        print(f"[{i}/{enabled_count}] {name}")
-
-        companies = fetch_from_free_source(source_id, source_config)
+    # Fetch all enabled sources at once
+    all_companies = []
+    for companies in asyncio.run(_fetch_all_free_sources(enabled_sources)):
         all_companies.extend(companies)
 
-        # Small delay between sources
-        time.sleep(0.5)
-
-    # Deduplicate by domain
-    unique_companies = []
-    seen_domains = set()
-
+    # Deduplicate by domain (first company seen for a domain wins)
+    by_domain = {}
     for company in all_companies:
         try:
             domain = extract_domain(company['url'])
-            if domain not in seen_domains:
-                seen_domains.add(domain)
-                unique_companies.append(company)
-        except:
+        except Exception:
             continue
+        by_domain.setdefault(domain, company)
+    unique_companies = list(by_domain.values())
 
     print(f"\n{'=' * 60}")
     print(f"📊 TOTAL UNIQUE COMPANIES FOUND: {len(unique_companies)}")
@@ -1038,11 +1384,8 @@ def main():
     init_db()
 
     # 2) Import contacts from JSON files BEFORE doing anything else
-    json_files = list(BASE_DIR.glob("contacts*.json"))
-    if json_files:
-        # Sort by modification time (newest first)
-        json_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        latest_file = json_files[0]
+    latest_file = latest_contacts_json(BASE_DIR)
+    if latest_file:
         print(f"📥 Importing contacts from: {latest_file.name}")
         import_json_contacts(latest_file)  # <-- Call existing function with Path
     else:
@@ -1053,6 +1396,7 @@ def main():
     if not companies:
         print("No companies found. Exiting.")
         return
+    save_discovered_companies(companies)
 
     # 4) Process companies with Hunter.io (limit to avoid chaos)
     max_to_process = min(50, len(companies))
@@ -1082,6 +1426,7 @@ if __name__ == "__main__":
         if not companies:
             print("No companies found in local file. Exiting.")
             sys.exit(0)
+        save_discovered_companies(companies)
 
         # 3) Process companies with Hunter.io
         max_to_process = min(50, len(companies))
@@ -2,11 +2,15 @@
 import os
 import time
 import sqlite3
+import contextlib
 import smtplib
+import socket
 import ssl
-from email.message import EmailMessage
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage, MIMEPart
 from pathlib import Path
 from datetime import datetime, timezone
+from db_admin import open_db, latest_contacts_json
 from dotenv import load_dotenv
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -14,6 +18,7 @@ load_dotenv(BASE_DIR / ".env")
 
 DRY_RUN = os.getenv("DRY_RUN", "false").lower() == "true"
 WHITELIST_MODE = os.getenv("WHITELIST_MODE", "false").lower() == "true"
+MAILER_DEBUG = os.getenv("MAILER_DEBUG", "false").lower() == "true"
 
 DB_PATH = (BASE_DIR / os.getenv("DB_PATH", "metacrawler.db")).resolve()
 print("USING DB:", DB_PATH)
@@ -36,48 +41,54 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def build_message(to_email: str, subject: str, body: str) -> EmailMessage:
+def build_attachment(resume_bytes: bytes, resume_name: str) -> MIMEPart:
+    """Encode the resume once; every message attaches this same part"""
+    part = MIMEPart()
+    part.set_content(
+        resume_bytes,
+        maintype="application",
+        subtype="pdf",
+        disposition="attachment",
+        filename=resume_name
+    )
+    return part
+
+
+def build_message(to_email: str, subject: str, body: str, attachment: MIMEPart) -> EmailMessage:
     msg = EmailMessage()
     msg["From"] = FROM_EMAIL
     msg["To"] = to_email
     msg["Subject"] = subject
     msg.set_content(body)
 
-    if not RESUME_PATH.exists():
-        raise FileNotFoundError(f"Resume not found: {RESUME_PATH}")
-
-    data = RESUME_PATH.read_bytes()
-    msg.add_attachment(
-        data,
-        maintype="application",
-        subtype="pdf",
-        filename=RESUME_PATH.name
-    )
+    msg.make_mixed()
+    msg.attach(attachment)
     return msg
 
 
 def fetch_send_queue(conn: sqlite3.Connection, limit: int):
     cur = conn.cursor()
 
-    # First, let's debug what's in the database
-    cur.execute("SELECT COUNT(*) FROM contacts WHERE contacted = 0")
-    pending_count = cur.fetchone()[0]
-    print(f"DEBUG: Found {pending_count} pending contacts in database")
-
-    cur.execute("SELECT COUNT(*) FROM companies")
-    company_count = cur.fetchone()[0]
-    print(f"DEBUG: Found {company_count} companies in database")
-
-    # Show first few pending contacts
-    cur.execute("""
-        SELECT c.id, c.email, c.name, c.confidence, c.type, co.domain, co.category
-        FROM contacts c
-        LEFT JOIN companies co ON co.id = c.company_id
-        WHERE c.contacted = 0
-        LIMIT 5
-    """)
-    sample = cur.fetchall()
-    print(f"DEBUG: Sample pending contacts: {sample}")
+    # Debug counts are full table scans, so only run them when asked
+    if MAILER_DEBUG:
+        cur.execute("SELECT COUNT(*) FROM contacts WHERE contacted = 0")
+        pending_count = cur.fetchone()[0]
+        print(f"DEBUG: Found {pending_count} pending contacts in database")
+
+        cur.execute("SELECT COUNT(*) FROM companies")
+        company_count = cur.fetchone()[0]
+        print(f"DEBUG: Found {company_count} companies in database")
+
+        # Show first few pending contacts
+        cur.execute("""
+            SELECT c.id, c.email, c.name, c.confidence, c.type, co.domain, co.category
+            FROM contacts c
+            LEFT JOIN companies co ON co.id = c.company_id
+            WHERE c.contacted = 0
+            LIMIT 5
+        """)
+        sample = cur.fetchall()
+        print(f"DEBUG: Sample pending contacts: {sample}")
 
     # Now run the actual query
     cur.execute("""
@@ -93,33 +104,29 @@ def fetch_send_queue(conn: sqlite3.Connection, limit: int):
     """, (limit,))
     return cur.fetchall()
 
-def mark_sent(conn: sqlite3.Connection, contact_id: int):
-    conn.execute("""
-        UPDATE contacts
-        SET contacted = 1, contacted_at = ?, last_error = NULL
-        WHERE id = ?
-    """, (utc_now_iso(), contact_id))
+# Fixed statement text so sqlite3's per-connection statement cache reuses the prepared query
+MARK_SQL = """
+    UPDATE contacts
+    SET contacted = 1, contacted_at = ?, last_error = NULL
+    WHERE id = ?
+"""
 
+FAIL_SQL = """
+    UPDATE contacts
+    SET contacted = -1, contacted_at = ?, last_error = ?
+    WHERE id = ?
+"""
 
-def dismiss_failed(conn: sqlite3.Connection, contact_id: int, err: str):
-    conn.execute("""
-        UPDATE contacts
-        SET contacted = -1, contacted_at = ?, last_error = ?
-        WHERE id = ?
-    """, (utc_now_iso(), (err or "")[:500], contact_id))
 
+def mark_sent(cur: sqlite3.Cursor, contact_id: int):
+    cur.execute(MARK_SQL, (utc_now_iso(), contact_id))
 
-def default_body(domain: str, category: str | None, name: str | None = None, email_type: str | None = None) -> str:
-    cat = category or "engineering"
 
-    # Don't personalize generic inboxes (jobs@, info@, etc.)
-    first = None
-    if (email_type or "").lower() != "generic":
-        if name and name.strip() and name.strip().upper() != "N/A":
-            first = name.strip().split()[0]
+def dismiss_failed(cur: sqlite3.Cursor, contact_id: int, err: str):
+    cur.execute(FAIL_SQL, (utc_now_iso(), (err or "")[:500], contact_id))
 
-    greeting = f"Hello {first}," if first else "Hello,"
-    return f"""{greeting}
+
+BODY_FMT = """{greeting}
 
 I'm reaching out regarding {cat} roles at {domain}.
 
@@ -130,11 +137,25 @@ FLE
 """
 
 
+def default_body(domain: str, category: str | None, name: str | None = None, email_type: str | None = None) -> str:
+    cat = category or "engineering"
+
+    # Don't personalize generic inboxes (jobs@, info@, etc.)
+    first = None
+    if (email_type or "").lower() != "generic" and name:
+        parts = name.split()
+        if parts and name.strip().upper() != "N/A":
+            first = parts[0]
+
+    greeting = f"Hello {first}," if first else "Hello,"
+    return BODY_FMT.format(greeting=greeting, cat=cat, domain=domain)
+
+
 def check_and_import_json_if_empty():
     """Check if database is empty and import from JSON if needed"""
     print("Checking database status...")
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with contextlib.closing(open_db(DB_PATH, cached_statements=256)) as conn:
         cur = conn.cursor()
 
         # Check if we have any pending contacts
@@ -153,12 +174,9 @@ def check_and_import_json_if_empty():
             print("⚠ Database is empty. Checking for JSON files...")
 
             # Look for JSON files
-            json_files = list(BASE_DIR.glob("contacts*.json"))
+            latest_file = latest_contacts_json(BASE_DIR)
 
-            if json_files:
-                # Sort by modification time (newest first)
-                json_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-                latest_file = json_files[0]
+            if latest_file:
 
                 print(f"📥 Found JSON file: {latest_file.name}")
                 print("Would you like to import contacts from JSON?")
@@ -176,13 +194,87 @@ def check_and_import_json_if_empty():
             return False
 
 
-def test_smtp_connection(server):
-    """Test if SMTP connection is still alive"""
-    try:
-        status = server.noop()[0]
-        return status == 250
-    except:
-        return False
+_SMTP_ADDRS: dict[int, list[str]] = {}
+
+
+def _smtp_addrs(family: int = socket.AF_UNSPEC) -> list[str]:
+    """Resolve SMTP_HOST once per process; reconnects reuse the address list"""
+    if family not in _SMTP_ADDRS:
+        addrinfos = socket.getaddrinfo(
+            SMTP_HOST, SMTP_PORT,
+            family,
+            socket.SOCK_STREAM,
+            socket.IPPROTO_TCP
+        )
+        if not addrinfos:
+            raise socket.gaierror(f"No addresses found for {SMTP_HOST}")
+        _SMTP_ADDRS[family] = list(dict.fromkeys(ai[4][0] for ai in addrinfos))
+    return _SMTP_ADDRS[family]
+
+
+class _PinnedSMTP(smtplib.SMTP):
+    """Dials the cached SMTP_HOST addresses; STARTTLS still verifies against the hostname"""
+
+    def _get_socket(self, host, port, timeout):
+        # Try every resolved address in order, like socket.create_connection
+        err = None
+        for addr in _smtp_addrs():
+            try:
+                return super()._get_socket(addr, port, timeout)
+            except OSError as e:
+                err = e
+        raise err
+
+
+def _connect_smtp() -> smtplib.SMTP:
+    """Open, STARTTLS and (unless whitelisted) authenticate an SMTP session"""
+    print(f"🔌 Connecting to {SMTP_HOST}:{SMTP_PORT}...")
+    print(f"   Mode: {'IP Whitelist' if WHITELIST_MODE else 'SMTP Auth'}")
+    print(f"   HELO Domain: {HELO_DOMAIN}")
+
+    ctx = ssl.create_default_context()
+
+    # CHECK IF IN GOOGLE ADMIN MODE
+    import sys
+    if '--google-admin' in sys.argv:
+        # Force IPv4 connection
+        print("⚡ Google Admin mode: Forcing IPv4...")
+        ip, port = _smtp_addrs(socket.AF_INET)[0], SMTP_PORT
+        print(f"   Connecting via IPv4: {ip}:{port}")
+
+        # Create custom SSL context for IP connection
+        ipv4_ctx = ssl.create_default_context()
+        ipv4_ctx.check_hostname = False  # Allow IP connection
+        ipv4_ctx.verify_mode = ssl.CERT_NONE  # Skip cert verification
+
+        server = smtplib.SMTP(ip, port, timeout=30)
+
+        # Always identify with HELO domain
+        server.ehlo(HELO_DOMAIN)
+        server.starttls(context=ipv4_ctx)  # Use custom context
+        server.ehlo(HELO_DOMAIN)  # Again after STARTTLS
+
+    else:
+        # Normal connection
+        server = _PinnedSMTP(SMTP_HOST, SMTP_PORT, timeout=30)
+
+        # Always identify with HELO domain
+        server.ehlo(HELO_DOMAIN)
+        server.starttls(context=ctx)
+        server.ehlo(HELO_DOMAIN)  # Again after STARTTLS
+
+    # Only authenticate if NOT in whitelist mode
+    if not WHITELIST_MODE:
+        if SMTP_USER and SMTP_PASS:
+            print(f"🔐 Authenticating as {SMTP_USER}...")
+            server.login(SMTP_USER, SMTP_PASS)
+            print("✅ Authentication successful")
+        else:
+            print("⚠ No credentials provided for auth mode. Assuming IP whitelist.")
+    else:
+        print("✅ Using IP whitelist (no authentication)")
+
+    return server
 
 
 def run_mailer():
@@ -194,7 +286,10 @@ def run_mailer():
     if not RESUME_PATH.exists():
         raise FileNotFoundError(f"Resume not found: {RESUME_PATH}")
 
-    with sqlite3.connect(DB_PATH) as conn:
+    # Read and encode the resume once per run rather than once per email
+    attachment = build_attachment(RESUME_PATH.read_bytes(), RESUME_PATH.name)
+
+    with contextlib.closing(open_db(DB_PATH, cached_statements=256)) as conn:
         rows = fetch_send_queue(conn, MAX_PER_RUN)
         if not rows:
             print("No pending contacts to email.")
@@ -209,92 +304,51 @@ def run_mailer():
             if not FROM_EMAIL:
                 raise RuntimeError("Missing FROM_EMAIL env var")
 
-            print(f"🔌 Connecting to {SMTP_HOST}:{SMTP_PORT}...")
-            print(f"   Mode: {'IP Whitelist' if WHITELIST_MODE else 'SMTP Auth'}")
-            print(f"   HELO Domain: {HELO_DOMAIN}")
-
-            ctx = ssl.create_default_context()
-
-            # CHECK IF IN GOOGLE ADMIN MODE
-            import sys
-            if '--google-admin' in sys.argv:
-                # Force IPv4 connection
-                import socket
-                print("⚡ Google Admin mode: Forcing IPv4...")
-                addrinfos = socket.getaddrinfo(
-                    SMTP_HOST, SMTP_PORT,
-                    socket.AF_INET,  # IPv4 only
-                    socket.SOCK_STREAM,
-                    socket.IPPROTO_TCP
-                )
+            server = _connect_smtp()
 
-                if not addrinfos:
-                    raise socket.gaierror(f"No IPv4 addresses found for {SMTP_HOST}")
-
-                ip, port = addrinfos[0][4][0], addrinfos[0][4][1]
-                print(f"   Connecting via IPv4: {ip}:{port}")
-
-                # Create custom SSL context for IP connection
-                ipv4_ctx = ssl.create_default_context()
-                ipv4_ctx.check_hostname = False  # Allow IP connection
-                ipv4_ctx.verify_mode = ssl.CERT_NONE  # Skip cert verification
-
-                server = smtplib.SMTP(ip, port, timeout=30)
-
-                # Always identify with HELO domain
-                server.ehlo(HELO_DOMAIN)
-                server.starttls(context=ipv4_ctx)  # Use custom context
-                server.ehlo(HELO_DOMAIN)  # Again after STARTTLS
-
-            else:
-                # Normal connection
-                server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30)
-
-                # Always identify with HELO domain
-                server.ehlo(HELO_DOMAIN)
-                server.starttls(context=ctx)
-                server.ehlo(HELO_DOMAIN)  # Again after STARTTLS
-
-            # Only authenticate if NOT in whitelist mode
-            if not WHITELIST_MODE:
-                if SMTP_USER and SMTP_PASS:
-                    print(f"🔐 Authenticating as {SMTP_USER}...")
-                    server.login(SMTP_USER, SMTP_PASS)
-                    print("✅ Authentication successful")
-                else:
-                    print("⚠ No credentials provided for auth mode. Assuming IP whitelist.")
-            else:
-                print("✅ Using IP whitelist (no authentication)")
+        def prepare(row) -> EmailMessage:
+            _, to_email, name, _, email_type, domain, category, _ = row
+            subject = f"Application: {(category or 'Engineering')} roles"
+            body = default_body(domain, category, name=name, email_type=email_type)
+            return build_message(to_email, subject, body, attachment)
 
+        # Build the next message on a worker thread while the current one is on the wire
+        builder = ThreadPoolExecutor(max_workers=1)
         try:
             sent = 0
             failed = 0
+            status_cur = conn.cursor()
+            next_msg = builder.submit(prepare, rows[0])
             for i, r in enumerate(rows, 1):
                 contact_id, to_email, name, confidence, email_type, domain, category, last_error = r
 
-                subject = f"Application: {(category or 'Engineering')} roles"
-                body = default_body(domain, category, name=name, email_type=email_type)
+                msg_future = next_msg
+                if i < len(rows):
+                    next_msg = builder.submit(prepare, rows[i])
 
                 try:
-                    msg = build_message(to_email, subject, body)
+                    msg = msg_future.result()
 
                     if DRY_RUN:
                         print(f"[DRY RUN {i}/{len(rows)}] Would send -> {to_email} ({domain})")
                     else:
-                        # Check connection before sending
-                        if not test_smtp_connection(server):
+                        try:
+                            server.send_message(msg)
+                        except smtplib.SMTPServerDisconnected:
+                            # Dropped session: release its socket, reconnect and retry this message once
                             print("⚠ Connection lost, reconnecting...")
-                            server.ehlo(HELO_DOMAIN)
-
-                        server.send_message(msg)
+                            with contextlib.suppress(Exception):
+                                server.close()
+                            server = _connect_smtp()
+                            server.send_message(msg)
 
-                    mark_sent(conn, contact_id)
+                    mark_sent(status_cur, contact_id)
                     conn.commit()
                     sent += 1
                     print(f"✅ Sent [{sent}/{len(rows)}] -> {to_email}")
 
                 except Exception as e:
-                    dismiss_failed(conn, contact_id, str(e))
+                    dismiss_failed(status_cur, contact_id, str(e))
                     conn.commit()
                     print(f"❌ Failed -> {to_email}: {e}")
                     failed += 1
@@ -305,6 +359,7 @@ def run_mailer():
                     time.sleep(SEND_DELAY)
 
         finally:
+            builder.shutdown(cancel_futures=True)
             if server is not None:
                 server.quit()
                 print("🔌 SMTP connection closed")
@@ -0,0 +1,58 @@
+# db_admin.py - Shared SQLite and contacts-file helpers for the crawler, mailer, importer and launcher
+import os
+import sqlite3
+from pathlib import Path
+
+
+class _Connection(sqlite3.Connection):
+    """Connection that refreshes planner statistics before it closes"""
+
+    def close(self):
+        try:
+            self.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        super().close()
+
+
+def open_db(path: Path, **connect_kwargs) -> sqlite3.Connection:
+    """Open the database in WAL mode with relaxed sync and a big page cache"""
+    conn = sqlite3.connect(path, factory=_Connection, **connect_kwargs)
+    # page_size only sticks on a brand-new file, and must be set before WAL is enabled
+    conn.executescript(
+        "PRAGMA page_size=8192;"
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-65536;"
+        "PRAGMA mmap_size=268435456;"
+    )
+    return conn
+
+
+def company_ids(cur: sqlite3.Cursor, domains) -> dict[str, int]:
+    """domain -> companies.id, 500 domains per SELECT (SQLite caps the number of bound parameters)"""
+    domains = list(dict.fromkeys(domains))
+    ids = {}
+    for i in range(0, len(domains), 500):
+        chunk = domains[i:i + 500]
+        ids.update(cur.execute(
+            f"SELECT domain, id FROM companies WHERE domain IN ({','.join('?' * len(chunk))})",
+            chunk,
+        ))
+    return ids
+
+
+def list_json(directory: Path, prefix: str = "", suffix: str = ".json") -> list[tuple[str, os.stat_result]]:
+    """(name, stat) for matching files in directory from a single scandir pass"""
+    with os.scandir(directory) as it:
+        return [(e.name, e.stat()) for e in it
+                if e.is_file(follow_symlinks=False) and e.name.startswith(prefix) and e.name.endswith(suffix)]
+
+
+def latest_contacts_json(directory: Path) -> Path | None:
+    """Newest contacts*.json in directory"""
+    json_files = list_json(directory, "contacts")
+    if not json_files:
+        return None
+    return directory / max(json_files, key=lambda entry: entry[1].st_mtime)[0]
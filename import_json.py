@@ -1,61 +1,72 @@
-import json
-import sqlite3
+import orjson
+import contextlib
 from pathlib import Path
+from db_admin import open_db, company_ids, latest_contacts_json
 
 BASE_DIR = Path(__file__).resolve().parent
 DB_PATH = BASE_DIR / "metacrawler.db"
 
 def import_latest_json():
     """Import contacts from latest JSON file"""
-    json_files = list(BASE_DIR.glob("contacts*.json"))
+    latest_file = latest_contacts_json(BASE_DIR)
 
-    if not json_files:
+    if not latest_file:
         print("❌ No contacts*.json files found!")
         return
 
-    json_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    latest_file = json_files[0]
-
     print(f"📥 Importing from: {latest_file.name}")
 
-    with open(latest_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    conn = sqlite3.connect(DB_PATH)
-    imported = 0
+    data = orjson.loads(latest_file.read_bytes())
 
+    # Collect rows first so the whole import is two executemany calls in one transaction
+    company_rows = []
+    contact_rows = []
+    add_company = company_rows.append
+    add_contact = contact_rows.append
     for item in data:
         domain = (item.get("domain") or "").strip()
         if not domain:
             continue
 
-        # Insert company
-        conn.execute(
-            "INSERT OR IGNORE INTO companies (domain, organization, category) VALUES(?, ?, ?)",
-            (domain, item.get("organization") or domain, 'engineering')
-        )
+        add_company((domain, item.get("organization") or domain, 'engineering'))
 
-        # Get company ID
-        cur = conn.execute("SELECT id FROM companies WHERE domain = ?", (domain,))
-        result = cur.fetchone()
+        for c in item.get("contacts", []):
+            get = c.get
+            email = (get("email") or "").strip()
+            if not email:
+                continue
+            add_contact((domain, email, get("name", ""), get("confidence", 0), get("type", "generic")))
 
-        if result:
-            company_id = result[0]
+    # isolation_level=None: no hidden implicit transactions, callers BEGIN/COMMIT explicitly
+    with contextlib.closing(open_db(DB_PATH, isolation_level=None)) as conn, conn:
+        cur = conn.cursor()
+        # One explicit write transaction for the whole import; `with conn` commits or rolls back
+        cur.execute("BEGIN IMMEDIATE")
 
-            # Insert contacts
-            for c in item.get("contacts", []):
-                email = (c.get("email") or "").strip()
-                if not email:
-                    continue
+        # Known companies come from one scan; only new domains are inserted and looked up
+        domain_ids = dict(cur.execute("SELECT domain, id FROM companies").fetchall())
+        new_companies = {}
+        for row in company_rows:
+            if row[0] not in domain_ids:
+                new_companies.setdefault(row[0], row)  # first row for a domain wins, as with OR IGNORE
+        new_rows = list(new_companies.values())
 
-                conn.execute(
-                    "INSERT OR IGNORE INTO contacts (company_id, email, name, confidence, type, contacted) VALUES (?, ?, ?, ?, ?, 0)",
-                    (company_id, email, c.get("name", ""), c.get("confidence", 0), c.get("type", "generic"))
-                )
-                imported += 1
+        cur.executemany(
+            "INSERT OR IGNORE INTO companies (domain, organization, category) VALUES(?, ?, ?)",
+            new_rows
+        )
+
+        # Get new company IDs in chunks
+        domain_ids.update(company_ids(cur, (row[0] for row in new_rows)))
+
+        # Insert contacts
+        cur.executemany(
+            "INSERT OR IGNORE INTO contacts (company_id, email, name, confidence, type, contacted) VALUES (?, ?, ?, ?, ?, 0)",
+            [(domain_ids[domain], email, name, confidence, ctype)
+             for domain, email, name, confidence, ctype in contact_rows if domain in domain_ids]
+        )
+        imported = len(contact_rows)
 
-    conn.commit()
-    conn.close()
     print(f"✅ Imported {imported} contacts from JSON")
 
 if __name__ == "__main__":
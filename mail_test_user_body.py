@@ -7,7 +7,8 @@ Users should copy to test_email.py and fill in their own details
 import os
 import smtplib
 import ssl
-from email.message import EmailMessage
+from email.message import EmailMessage, MIMEPart
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -29,6 +30,20 @@ RESUME_PATH = rp if rp.is_absolute() else (BASE_DIR / rp).resolve()
 TEST_EMAIL = os.getenv("TEST_EMAIL", "your-email@example.com")
 
 
+@lru_cache(maxsize=1)
+def resume_attachment() -> MIMEPart:
+    """Read and encode the resume once; repeat sends attach the same part"""
+    part = MIMEPart()
+    part.set_content(
+        RESUME_PATH.read_bytes(),
+        maintype="application",
+        subtype="pdf",
+        disposition="attachment",
+        filename=RESUME_PATH.name
+    )
+    return part
+
+
 def send_test_email():
     """Send a test email to yourself to verify formatting"""
     print("📧 Sending test email...")
@@ -86,13 +101,9 @@ Best,
     # Add resume if exists
     if RESUME_PATH.exists():
         try:
-            data = RESUME_PATH.read_bytes()
-            msg.add_attachment(
-                data,
-                maintype="application",
-                subtype="pdf",
-                filename=RESUME_PATH.name
-            )
+            attachment = resume_attachment()
+            msg.make_mixed()
+            msg.attach(attachment)
             print(f"   Attached: {RESUME_PATH.name}")
         except Exception as e:
             print(f"   Warning: Could not attach resume: {e}")
@@ -104,14 +115,18 @@ Best,
         print(f"\n🚀 Connecting to {SMTP_HOST}:{SMTP_PORT}...")
         ctx = ssl.create_default_context()
 
-        server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30)
-        server.ehlo()
-        server.starttls(context=ctx)
-        server.ehlo()
-        server.login(SMTP_USER, SMTP_PASS)
-
-        server.send_message(msg)
-        server.quit()
+        if SMTP_PORT == 465:
+            # Implicit TLS: the handshake happens on connect, no STARTTLS round trips
+            server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, context=ctx, timeout=30)
+        else:
+            server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30)
+            server.ehlo()
+            server.starttls(context=ctx)
+            server.ehlo()
+
+        with server:
+            server.login(SMTP_USER, SMTP_PASS)
+            server.send_message(msg)
 
         print(f"✅ Test email sent to {TEST_EMAIL}!")
         print("   Check your inbox to verify formatting.")
@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 # run.py - Unified launcher for the job crawler system
+import heapq
 import sys
 import subprocess
 from pathlib import Path
 from datetime import datetime
+from db_admin import open_db, list_json
 
 BASE_DIR = Path(__file__).resolve().parent
 
+# Absolute script paths so launches don't depend on the current directory
+CRAWLER = BASE_DIR / "Crawler.py"
+MAILER = BASE_DIR / "Mailer.py"
+IMPORTER = BASE_DIR / "import_json.py"
+SCRIPT_EXISTS = {script: script.exists() for script in (CRAWLER, MAILER, IMPORTER)}
+DB_PATH = BASE_DIR / "metacrawler.db"
+
 
 def show_menu():
     print("\n" + "=" * 60)
@@ -30,12 +39,13 @@ def run_crawler():
     print("\n" + "=" * 60)
     print("RUNNING CRAWLER")
     print("=" * 60)
+    if not SCRIPT_EXISTS[CRAWLER]:
+        print("❌ Crawler.py not found!")
+        return
     try:
-        subprocess.run([sys.executable, "crawler.py"], check=True)
+        subprocess.run([sys.executable, str(CRAWLER)], check=True, cwd=BASE_DIR)
     except subprocess.CalledProcessError as e:
         print(f"❌ Crawler failed with error: {e}")
-    except FileNotFoundError:
-        print("❌ crawler.py not found!")
 
 
 def run_crawler_local_only():
@@ -46,51 +56,52 @@ def run_crawler_local_only():
 
     # We need to modify crawler.py to have this option
     # Option A: Pass command-line argument to crawler.py
+    if not SCRIPT_EXISTS[CRAWLER]:
+        print("❌ Crawler.py not found!")
+        return
     try:
-        subprocess.run([sys.executable, "crawler.py", "--local-only"], check=True)
+        subprocess.run([sys.executable, str(CRAWLER), "--local-only"], check=True, cwd=BASE_DIR)
     except subprocess.CalledProcessError as e:
         print(f"❌ Local-only crawler failed with error: {e}")
-    except FileNotFoundError:
-        print("❌ crawler.py not found!")
 
 
 def run_mailer():
     print("\n" + "=" * 60)
     print("RUNNING MAILER")
     print("=" * 60)
+    if not SCRIPT_EXISTS[MAILER]:
+        print("❌ Mailer.py not found!")
+        return
     try:
-        subprocess.run([sys.executable, "mailer.py"], check=True)
+        subprocess.run([sys.executable, str(MAILER)], check=True, cwd=BASE_DIR)
     except subprocess.CalledProcessError as e:
         print(f"❌ Mailer failed with error: {e}")
-    except FileNotFoundError:
-        print("❌ mailer.py not found!")
 
 def run_mailer_google_admin():
     """Run mailer with Google Admin IPv4-only connection"""
     print("\n" + "=" * 60)
     print("RUNNING MAILER (GOOGLE ADMIN IPv4 MODE)")
     print("=" * 60)
+    if not SCRIPT_EXISTS[MAILER]:
+        print("❌ Mailer.py not found!")
+        return
     try:
-        # Pass --google-admin flag to mailer.py
-        subprocess.run([sys.executable, "mailer.py", "--google-admin"], check=True)
+        # Pass --google-admin flag to Mailer.py
+        subprocess.run([sys.executable, str(MAILER), "--google-admin"], check=True, cwd=BASE_DIR)
     except subprocess.CalledProcessError as e:
         print(f"❌ Google Admin mailer failed with error: {e}")
-    except FileNotFoundError:
-        print("❌ mailer.py not found!")
 
 def import_json_only():
     print("\n" + "=" * 60)
     print("IMPORT JSON CONTACTS ONLY")
     print("=" * 60)
 
-    import_script = BASE_DIR / "import_json.py"
-
-    if not import_script.exists():
+    if not SCRIPT_EXISTS[IMPORTER]:
         print("❌ import_json.py not found!")
         print("Please create import_json.py with import logic")
         return
 
-    subprocess.run([sys.executable, "import_json.py"])
+    subprocess.run([sys.executable, str(IMPORTER)], cwd=BASE_DIR)
 
 
 def check_database():
@@ -98,31 +109,25 @@ def check_database():
     print("DATABASE STATUS")
     print("=" * 60)
 
-    import sqlite3
-
-    db_path = BASE_DIR / "metacrawler.db"
-    if not db_path.exists():
+    if not DB_PATH.exists():
         print("❌ Database file not found!")
         return
 
-    conn = sqlite3.connect(db_path)
+    conn = open_db(DB_PATH)
     cur = conn.cursor()
 
-    # Counts
+    # Counts (one pass over contacts for every status)
     cur.execute("SELECT COUNT(*) FROM companies")
     companies = cur.fetchone()[0]
 
-    cur.execute("SELECT COUNT(*) FROM contacts")
-    contacts = cur.fetchone()[0]
-
-    cur.execute("SELECT COUNT(*) FROM contacts WHERE contacted = 0")
-    pending = cur.fetchone()[0]
-
-    cur.execute("SELECT COUNT(*) FROM contacts WHERE contacted = 1")
-    sent = cur.fetchone()[0]
-
-    cur.execute("SELECT COUNT(*) FROM contacts WHERE contacted = -1")
-    failed = cur.fetchone()[0]
+    cur.execute("""
+        SELECT COUNT(*),
+               COALESCE(SUM(contacted = 0), 0),
+               COALESCE(SUM(contacted = 1), 0),
+               COALESCE(SUM(contacted = -1), 0)
+        FROM contacts
+    """)
+    contacts, pending, sent, failed = cur.fetchone()
 
     print(f"\n📊 Database Statistics:")
     print(f"   Companies: {companies}")
@@ -132,11 +137,11 @@ def check_database():
     print(f"   Failed (contacted=-1): {failed}")
 
     # Show JSON files
-    json_files = list(BASE_DIR.glob("contacts*.json"))
+    json_files = list_json(BASE_DIR, "contacts")
     print(f"\n📄 JSON Files: {len(json_files)}")
-    for json_file in sorted(json_files, key=lambda p: p.stat().st_mtime, reverse=True)[:3]:
-        mtime = datetime.fromtimestamp(json_file.stat().st_mtime)
-        print(f"   - {json_file.name} ({mtime})")
+    for name, st in heapq.nlargest(3, json_files, key=lambda entry: entry[1].st_mtime):
+        mtime = datetime.fromtimestamp(st.st_mtime)
+        print(f"   - {name} ({mtime})")
 
     conn.close()
 
@@ -146,14 +151,11 @@ def reset_contacts():
     print("RESET CONTACT STATUS")
     print("=" * 60)
 
-    import sqlite3
-
-    db_path = BASE_DIR / "metacrawler.db"
-    if not db_path.exists():
+    if not DB_PATH.exists():
         print("❌ Database file not found!")
         return
 
-    conn = sqlite3.connect(db_path)
+    conn = open_db(DB_PATH)
     cur = conn.cursor()
 
     # Show current status
@@ -177,6 +179,10 @@ def reset_contacts():
 
     choice = input("\nEnter choice (1-3): ").strip()
 
+    # Take the write lock up front so the reset is one transaction with one fsync
+    if choice in ("1", "2"):
+        cur.execute("BEGIN IMMEDIATE")
+
     if choice == "1":
         cur.execute("UPDATE contacts SET contacted = 0, contacted_at = NULL, last_error = NULL")
         print(f"✅ Reset ALL contacts to pending")